@@ -1,26 +1,37 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
 import json
 import os
 import secrets
-import smtplib
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 from functools import wraps
 from importlib.metadata import version as pkg_version
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-from flask import Flask, abort, current_app, flash, g, redirect, render_template, request, session, url_for
+from flask import Flask, abort, current_app, flash, g, has_app_context, redirect, render_template, request, session, url_for
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_session import Session
 from flask_sock import Sock
+from jinja2 import StrictUndefined
+from markupsafe import Markup
 from dotenv import load_dotenv
-from sqlalchemy import func, text, or_, and_
+from sqlalchemy import and_, bindparam, case, delete, event, func, or_, text, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload, undefer
 from werkzeug.security import check_password_hash, generate_password_hash
-from werkzeug.utils import secure_filename
 import requests
 import redis
 
@@ -31,10 +42,12 @@ try:
         DomaineAccueil,
         EquipePropos,
         Header,
+        MailCampaign,
         MembreNotreEquipe,
         Message,
         Realisation,
         ReseauFooter,
+        SchemaMeta,
         ServicePeople,
         ServicesCatalog,
         ServicesFooter,
@@ -49,10 +62,12 @@ except ImportError:
         DomaineAccueil,
         EquipePropos,
         Header,
+        MailCampaign,
         MembreNotreEquipe,
         Message,
         Realisation,
         ReseauFooter,
+        SchemaMeta,
         ServicePeople,
         ServicesCatalog,
         ServicesFooter,
@@ -61,10 +76,20 @@ except ImportError:
         db,
     )
 
+if TYPE_CHECKING:
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+
 BASE_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = BASE_DIR.parent
 IMAGE_DIR = BASE_DIR / "static" / "images"
+# BASE_DIR is already resolved, so these need no further filesystem lookups.
+_STATIC_ROOT = str(BASE_DIR / "static") + os.sep
+_IMAGE_ROOT = str(IMAGE_DIR)
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+IMAGE_PREFIXES = frozenset({"service", "sp", "project", "member", "logo"})
+IMAGE_SIGNATURES = (b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n")
+UPLOAD_CHUNK_SIZE = 1 << 20
 
 SITE_NAME = "Digital Get Services"
 SITE_PAGE_SET = {
@@ -79,6 +104,20 @@ SITE_PAGE_SET = {
     "compte",
     "profil",
 }
+NAV_ITEMS = (
+    ("accueil", "Accueil"),
+    ("propos", "A propos"),
+    ("services", "Services"),
+    ("realisation", "Realisations"),
+    ("notreEquipe", "Notre equipe"),
+    ("formulaire", "Contact"),
+)
+BARE_CONTEXT_ENDPOINTS = frozenset({"root", "site_root", "static"})
+CONTACT_FIELDS = ("nom", "prenom", "tel", "email", "entreprise", "message")
+LEGACY_SERVICE_FIELDS = ("nom", "description", "criteres_services")
+PROJECT_FIELDS = ("nom", "description", "lien_button", "criteres_services", "categorie")
+MEMBER_FIELDS = ("nom", "role")
+ADMIN_PAGE_SIZE = 50
 
 load_dotenv(BASE_DIR / ".env")
 
@@ -86,6 +125,27 @@ limiter = Limiter(key_func=get_remote_address)
 sock = Sock()
 session_ext = Session()
 CHAT_SOCKETS: list[dict[str, Any]] = []
+CHROME_CACHE_TTL = int(os.getenv("CHROME_CACHE_TTL", "30"))
+_FOOTER_CACHE: dict[str, Any] = {"v": 0, "data": None, "data_v": -1, "expires": 0.0}
+_MISSING = object()
+_DUMMY_HASHES: dict[str, str] = {}
+SITE_CONTEXT_TTL = int(os.getenv("SITE_CONTEXT_TTL", "30"))
+_SITE_CONTEXT_CACHE: dict[str, Any] = {"v": 0, "pages": {}}
+_SITE_CONTEXT_LOCK = threading.Lock()
+SCHEMA_REVISION = 1
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "cache_size=-20000",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+)
+MAIL_CAMPAIGN_TIMEOUT = int(os.getenv("MAIL_CAMPAIGN_TIMEOUT", "21600"))
+MAIL_PROGRESS_EVERY = 25
+MAIL_CONNECTION_RECYCLE = int(os.getenv("MAIL_SMTP_RECYCLE", "100"))
+PASSWORD_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("PASSWORD_HASH_WORKERS", "2")), thread_name_prefix="pwhash")
+FILE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="unlink")
+MAIL_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("MAIL_WORKERS", "2")), thread_name_prefix="mail")
 
 
 def _version_tuple(value: str) -> tuple[int, ...]:
@@ -113,6 +173,8 @@ def create_app() -> Flask:
     app.config["SECRET_KEY"] = os.getenv("FLASK_SECRET_KEY", "change-me-dev-secret")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["SQLALCHEMY_DATABASE_URI"] = resolve_database_uri()
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = resolve_engine_options(app.config["SQLALCHEMY_DATABASE_URI"])
+    app.config["PASSWORD_HASH_METHOD"] = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
     app.config["MAIL_ENABLED"] = os.getenv("MAIL_ENABLED", "1") != "0"
     app.config["MAIL_HOST"] = os.getenv("MAIL_SMTP_HOST", "")
     app.config["MAIL_PORT"] = int(os.getenv("MAIL_SMTP_PORT", "25"))
@@ -121,6 +183,7 @@ def create_app() -> Flask:
     app.config["MAIL_PASSWORD"] = os.getenv("MAIL_SMTP_PASSWORD", "")
     app.config["MAIL_USE_TLS"] = os.getenv("MAIL_SMTP_USE_TLS", "1") == "1"
     app.config["MAIL_USE_SSL"] = os.getenv("MAIL_SMTP_USE_SSL", "0") == "1"
+    app.config["MAIL_ASYNC"] = os.getenv("MAIL_ASYNC", "1") != "0"
     app.config["CONTACT_EMAIL"] = os.getenv("CONTACT_EMAIL", "fedcomfood@gmail.com")
     redis_url = os.getenv("REDIS_URL", "").strip()
     ratelimit_storage = os.getenv("RATELIMIT_STORAGE_URI", "").strip()
@@ -144,6 +207,7 @@ def create_app() -> Flask:
         session_type = "filesystem"
     app.config["SESSION_TYPE"] = session_type
     app.config["SESSION_PERMANENT"] = False
+    app.config["SESSION_REFRESH_EACH_REQUEST"] = False
     app.config["SESSION_USE_SIGNER"] = True
     app.config["SESSION_KEY_PREFIX"] = os.getenv("SESSION_KEY_PREFIX", "dgs:session:")
     if session_type == "redis":
@@ -157,34 +221,31 @@ def create_app() -> Flask:
     limiter.init_app(app)
     sock.init_app(app)
     session_ext.init_app(app)
+    initialize_database_once(app)
     with app.app_context():
-        db.create_all()
-        ensure_schema_compatibility()
-        seed_default_admin()
+        # Built up front so the first unknown-email login does not pay for it on top of the check.
+        dummy_password_hash()
 
     @app.context_processor
     def inject_globals() -> dict[str, Any]:
-        return {
+        context = {
             "site_name": SITE_NAME,
-            "user": current_user(),
-            "header_data": Header.query.first(),
-            "nav_items": [
-                ("accueil", "Accueil"),
-                ("propos", "A propos"),
-                ("services", "Services"),
-                ("realisation", "Realisations"),
-                ("notreEquipe", "Notre equipe"),
-                ("formulaire", "Contact"),
-            ],
-            "footer_socials": ReseauFooter.query.all(),
-            "footer_services": ServicesFooter.query.all(),
-            "footer_contact": ContactFooter.query.first(),
-            "csrf_token": get_or_create_csrf_token(),
+            "nav_items": NAV_ITEMS,
             "active_page": getattr(g, "active_page", ""),
             "current_year": datetime.now().year,
-            "hcaptcha_site_key": current_app.config.get("HCAPTCHA_SITE_KEY", ""),
-            "hcaptcha_enabled": current_app.config.get("HCAPTCHA_ENABLED", False),
         }
+        # URLs that matched no route (mostly bots probing paths) get the 404 page without
+        # touching the database or the session.
+        if request.endpoint is None or request.endpoint in BARE_CONTEXT_ENDPOINTS:
+            return context
+        context.update(
+            user=current_user(),
+            csrf_token=get_or_create_csrf_token(),
+            hcaptcha_site_key=current_app.config.get("HCAPTCHA_SITE_KEY", ""),
+            hcaptcha_enabled=current_app.config.get("HCAPTCHA_ENABLED", False),
+            **get_chrome_context(),
+        )
+        return context
 
     limited_login = limiter.limit("8 per minute")(handle_login)
     limited_register = limiter.limit("4 per minute")(handle_register)
@@ -213,9 +274,9 @@ def create_app() -> Flask:
         if page in {"compte", "profil"}:
             return handle_profile()
         if page == "formulaire":
-            return render_template("site/formulaire.html")
+            return render_site_page("site/formulaire.html")
 
-        return render_template(f"site/{page}.html", **build_site_context(page))
+        return render_site_page(f"site/{page}.html", **build_site_context(page))
 
     @app.post("/site/contact")
     @limiter.limit("5 per minute")
@@ -234,9 +295,8 @@ def create_app() -> Flask:
                 flash("Verification anti-spam invalide.", "danger")
                 return redirect(url_for("site_page", page="formulaire"))
 
-        required_fields = ["nom", "prenom", "tel", "email", "entreprise", "message"]
-        values = {k: request.form.get(k, "").strip() for k in required_fields}
-        if any(not values[k] for k in required_fields):
+        values = form_values(CONTACT_FIELDS)
+        if not all(values.values()):
             flash("Tous les champs sont obligatoires.", "danger")
             return redirect(url_for("site_page", page="formulaire"))
 
@@ -259,7 +319,10 @@ def create_app() -> Flask:
             f"<p><strong>Message :</strong><br>{values['message']}</p>"
         )
 
-        if send_mail(current_app.config["CONTACT_EMAIL"], subject, text_body, html_body, values["email"]):
+        if current_app.config["MAIL_ASYNC"]:
+            submit_mail_job(send_mail, current_app.config["CONTACT_EMAIL"], subject, text_body, html_body, values["email"])
+            flash("Votre message est en cours d'envoi.", "success")
+        elif send_mail(current_app.config["CONTACT_EMAIL"], subject, text_body, html_body, values["email"]):
             flash("Votre message a ete envoye avec succes.", "success")
         else:
             flash("Erreur lors de l'envoi du message.", "danger")
@@ -267,7 +330,7 @@ def create_app() -> Flask:
 
     @app.route("/site/logout")
     def site_logout() -> Any:
-        session.pop("site_user_id", None)
+        set_session_user(None)
         return redirect(url_for("site_page", page="login"))
 
     @app.route("/backoffice/login", methods=["GET", "POST"])
@@ -285,40 +348,38 @@ def create_app() -> Flask:
             email = request.form.get("email", "").strip().lower()
             password = request.form.get("password", "")
             candidate = User.query.filter_by(email=email).first()
-            if not candidate or candidate.role != "admin" or int(candidate.is_active or 0) != 1:
+            password_ok = check_password(candidate.password_hash if candidate else None, password)
+            if not candidate or candidate.role != "admin" or not candidate.active or not password_ok:
                 flash("Identifiants invalides.", "danger")
                 return redirect(url_for("backoffice_login"))
-            if not check_password_hash(candidate.password_hash, password):
-                flash("Identifiants invalides.", "danger")
-                return redirect(url_for("backoffice_login"))
-            session["site_user_id"] = candidate.id
+            set_session_user(candidate)
             return redirect(url_for("backoffice_index"))
 
         return render_template("admin/login.html")
 
     @app.route("/backoffice/logout")
     def backoffice_logout() -> Any:
-        session.pop("site_user_id", None)
+        set_session_user(None)
         return redirect(url_for("backoffice_login"))
 
     @app.route("/backoffice")
     @admin_required
     def backoffice_index() -> Any:
         g.active_page = "admin_index"
+        user_count, service_count, people_count, message_count = dashboard_counts()
         latest_users = User.query.order_by(User.id.desc()).limit(5).all()
         latest_messages = (
-            db.session.query(Message, User.full_name.label("sender_name"))
-            .join(User, User.id == Message.sender_id)
+            Message.query.options(joinedload(Message.sender, innerjoin=True))
             .order_by(Message.id.desc())
             .limit(5)
             .all()
         )
         return render_template(
             "admin/index.html",
-            user_count=User.query.count(),
-            service_count=ServicesCatalog.query.count(),
-            people_count=ServicePeople.query.count(),
-            message_count=Message.query.count(),
+            user_count=user_count,
+            service_count=service_count,
+            people_count=people_count,
+            message_count=message_count,
             latest_users=latest_users,
             latest_messages=latest_messages,
         )
@@ -341,62 +402,81 @@ def create_app() -> Flask:
                     flash("Nom, email et mot de passe sont obligatoires.", "danger")
                 elif role not in {"admin", "agent", "client"}:
                     flash("Role invalide.", "danger")
-                elif User.query.filter_by(email=email).first():
-                    flash("Email deja utilise.", "danger")
                 else:
                     db.session.add(
                         User(
                             full_name=full_name,
                             email=email,
-                            password_hash=generate_password_hash(password),
+                            password_hash=hash_password(password),
                             role=role,
                             is_active=1,
                             created_at=now_iso(),
                         )
                     )
-                    db.session.commit()
-                    flash("Utilisateur cree.", "success")
+                    try:
+                        db.session.commit()
+                    except IntegrityError:
+                        db.session.rollback()
+                        flash("Email deja utilise.", "danger")
+                    else:
+                        flash("Utilisateur cree.", "success")
 
             if action == "toggle_active":
                 user_id = int(request.form.get("id", "0"))
-                target = User.query.get(user_id)
-                me = current_user()
-                if target and me and target.id == me.id:
+                if user_id == g.user.id:
                     flash("Vous ne pouvez pas desactiver votre compte.", "danger")
-                elif target:
-                    target.is_active = 0 if int(target.is_active or 0) == 1 else 1
-                    db.session.commit()
-                    flash("Statut utilisateur mis a jour.", "success")
+                else:
+                    result = db.session.execute(
+                        update(User)
+                        .where(User.id == user_id)
+                        .values(is_active=case((User.is_active == 1, 0), else_=1))
+                        .execution_options(synchronize_session=False)
+                    )
+                    if result.rowcount:
+                        db.session.commit()
+                        flash("Statut utilisateur mis a jour.", "success")
 
             if action == "reset_password":
                 user_id = int(request.form.get("id", "0"))
                 new_password = request.form.get("new_password", "")
-                target = User.query.get(user_id)
-                if not target:
-                    flash("Utilisateur introuvable.", "danger")
-                elif len(new_password) < 8:
+                if len(new_password) < 8:
                     flash("Le mot de passe doit contenir au moins 8 caracteres.", "danger")
                 else:
-                    target.password_hash = generate_password_hash(new_password)
-                    db.session.commit()
-                    flash("Mot de passe reinitialise.", "success")
+                    result = db.session.execute(
+                        update(User)
+                        .where(User.id == user_id)
+                        .values(password_hash=hash_password(new_password))
+                        .execution_options(synchronize_session=False)
+                    )
+                    if result.rowcount:
+                        db.session.commit()
+                        flash("Mot de passe reinitialise.", "success")
+                    else:
+                        db.session.rollback()
+                        flash("Utilisateur introuvable.", "danger")
 
             if action == "change_role":
                 user_id = int(request.form.get("id", "0"))
                 new_role = request.form.get("role", "client")
-                target = User.query.get(user_id)
-                if not target:
-                    flash("Utilisateur introuvable.", "danger")
-                elif new_role not in {"admin", "agent", "client"}:
+                if new_role not in {"admin", "agent", "client"}:
                     flash("Role invalide.", "danger")
                 else:
-                    target.role = new_role
-                    db.session.commit()
-                    flash("Role utilisateur mis a jour.", "success")
+                    result = db.session.execute(
+                        update(User)
+                        .where(User.id == user_id)
+                        .values(role=new_role)
+                        .execution_options(synchronize_session=False)
+                    )
+                    if result.rowcount:
+                        db.session.commit()
+                        flash("Role utilisateur mis a jour.", "success")
+                    else:
+                        db.session.rollback()
+                        flash("Utilisateur introuvable.", "danger")
             return redirect(url_for("backoffice_users"))
 
-        users = User.query.order_by(User.id.desc()).all()
-        return render_template("admin/users.html", users=users)
+        pagination = paginate_admin(User.query.order_by(User.id.desc()))
+        return render_template("admin/users.html", users=pagination.items, pagination=pagination)
 
     @app.route("/backoffice/services", methods=["GET", "POST"])
     @admin_required
@@ -422,29 +502,36 @@ def create_app() -> Flask:
 
             if action == "update_catalog":
                 service_id = int(request.form.get("id", "0"))
-                target = ServicesCatalog.query.get(service_id)
-                if target:
-                    target.name = request.form.get("name", "").strip()
-                    target.description = request.form.get("description", "").strip()
-                    target.status = request.form.get("status", "active")
+                result = db.session.execute(
+                    update(ServicesCatalog)
+                    .where(ServicesCatalog.id == service_id)
+                    .values(
+                        name=request.form.get("name", "").strip(),
+                        description=request.form.get("description", "").strip(),
+                        status=request.form.get("status", "active"),
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount:
                     db.session.commit()
                     flash("Service mis a jour.", "success")
 
             if action == "delete_catalog":
                 service_id = int(request.form.get("id", "0"))
-                target = ServicesCatalog.query.get(service_id)
-                if target:
-                    db.session.delete(target)
+                result = db.session.execute(
+                    delete(ServicesCatalog)
+                    .where(ServicesCatalog.id == service_id)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount:
                     db.session.commit()
                     flash("Service supprime.", "success")
 
             if action == "create_legacy":
-                nom = request.form.get("nom", "").strip()
-                description = request.form.get("description", "").strip()
-                criteres_services = request.form.get("criteres_services", "").strip()
+                values = form_values(LEGACY_SERVICE_FIELDS)
                 photo = request.files.get("image")
 
-                if not nom:
+                if not values["nom"]:
                     flash("Le nom du service visuel est obligatoire.", "danger")
                 else:
                     image_name = save_image_upload(photo, prefix="service")
@@ -453,9 +540,7 @@ def create_app() -> Flask:
                     else:
                         db.session.add(
                             ServicesService(
-                                nom=nom,
-                                description=description,
-                                criteres_services=criteres_services,
+                                **values,
                                 libelleImage=image_name,
                                 is_suspended=0,
                             )
@@ -467,16 +552,15 @@ def create_app() -> Flask:
                 legacy_id = int(request.form.get("legacy_id", "0"))
                 target = ServicesService.query.get(legacy_id)
                 if target:
-                    target.nom = request.form.get("nom", "").strip()
-                    target.description = request.form.get("description", "").strip()
-                    target.criteres_services = request.form.get("criteres_services", "").strip()
+                    for field, value in form_values(LEGACY_SERVICE_FIELDS).items():
+                        setattr(target, field, value)
                     photo = request.files.get("image")
                     image_name = save_image_upload(photo, prefix="service")
                     if photo and photo.filename and not image_name:
                         flash("Image invalide (jpg, jpeg, png, webp).", "danger")
                     else:
                         if image_name:
-                            delete_static_image(target.libelleImage)
+                            schedule_image_delete(target.libelleImage)
                             target.libelleImage = image_name
                         db.session.commit()
                         flash("Service visuel mis a jour.", "success")
@@ -485,15 +569,21 @@ def create_app() -> Flask:
                 legacy_id = int(request.form.get("legacy_id", "0"))
                 target = ServicesService.query.get(legacy_id)
                 if target:
-                    delete_static_image(target.libelleImage)
+                    schedule_image_delete(target.libelleImage)
                     db.session.delete(target)
                     db.session.commit()
                     flash("Service visuel supprime.", "success")
+            invalidate_site_context_cache()
             return redirect(url_for("backoffice_services"))
 
         catalog_services = ServicesCatalog.query.order_by(ServicesCatalog.id.desc()).all()
-        legacy_services = ServicesService.query.order_by(ServicesService.id.desc()).all()
-        return render_template("admin/services.html", services=catalog_services, legacy_services=legacy_services)
+        pagination = paginate_admin(ServicesService.query.order_by(ServicesService.id.desc()))
+        return render_template(
+            "admin/services.html",
+            services=catalog_services,
+            legacy_services=pagination.items,
+            pagination=pagination,
+        )
 
     @app.route("/backoffice/people", methods=["GET", "POST"])
     @admin_required
@@ -530,9 +620,13 @@ def create_app() -> Flask:
 
             if action == "toggle_active":
                 person_id = int(request.form.get("id", "0"))
-                person = ServicePeople.query.get(person_id)
-                if person:
-                    person.is_active = 0 if int(person.is_active or 0) == 1 else 1
+                result = db.session.execute(
+                    update(ServicePeople)
+                    .where(ServicePeople.id == person_id)
+                    .values(is_active=case((ServicePeople.is_active == 1, 0), else_=1))
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount:
                     db.session.commit()
                     flash("Statut modifie.", "success")
 
@@ -540,15 +634,16 @@ def create_app() -> Flask:
                 person_id = int(request.form.get("id", "0"))
                 person = ServicePeople.query.get(person_id)
                 if person:
-                    delete_static_image(person.photo_path)
+                    schedule_image_delete(person.photo_path)
                     db.session.delete(person)
                     db.session.commit()
                     flash("Personne service supprimee.", "success")
+            invalidate_site_context_cache()
             return redirect(url_for("backoffice_people"))
 
         all_services = ServicesCatalog.query.filter_by(status="active").order_by(ServicesCatalog.name.asc()).all()
-        people = ServicePeople.query.order_by(ServicePeople.id.desc()).all()
-        return render_template("admin/people.html", all_services=all_services, people=people)
+        pagination = paginate_admin(ServicePeople.query.order_by(ServicePeople.id.desc()))
+        return render_template("admin/people.html", all_services=all_services, people=pagination.items, pagination=pagination)
 
     @app.route("/backoffice/projects", methods=["GET", "POST"])
     @admin_required
@@ -561,13 +656,9 @@ def create_app() -> Flask:
             action = request.form.get("action", "")
 
             if action == "create":
-                nom = request.form.get("nom", "").strip()
-                description = request.form.get("description", "").strip()
-                lien_button = request.form.get("lien_button", "").strip()
-                criteres_services = request.form.get("criteres_services", "").strip()
-                categorie = request.form.get("categorie", "").strip()
+                values = form_values(PROJECT_FIELDS)
                 photo = request.files.get("image")
-                if not nom:
+                if not values["nom"]:
                     flash("Le nom du projet est obligatoire.", "danger")
                 else:
                     image_name = save_image_upload(photo, prefix="project")
@@ -576,11 +667,7 @@ def create_app() -> Flask:
                     else:
                         db.session.add(
                             Realisation(
-                                nom=nom,
-                                description=description,
-                                lien_button=lien_button,
-                                criteres_services=criteres_services,
-                                categorie=categorie,
+                                **values,
                                 libelleImage=image_name,
                                 is_suspended=0,
                             )
@@ -592,18 +679,15 @@ def create_app() -> Flask:
                 project_id = int(request.form.get("id", "0"))
                 target = Realisation.query.get(project_id)
                 if target:
-                    target.nom = request.form.get("nom", "").strip()
-                    target.description = request.form.get("description", "").strip()
-                    target.lien_button = request.form.get("lien_button", "").strip()
-                    target.criteres_services = request.form.get("criteres_services", "").strip()
-                    target.categorie = request.form.get("categorie", "").strip()
+                    for field, value in form_values(PROJECT_FIELDS).items():
+                        setattr(target, field, value)
                     photo = request.files.get("image")
                     image_name = save_image_upload(photo, prefix="project")
                     if photo and photo.filename and not image_name:
                         flash("Image invalide (jpg, jpeg, png, webp).", "danger")
                     else:
                         if image_name:
-                            delete_static_image(target.libelleImage)
+                            schedule_image_delete(target.libelleImage)
                             target.libelleImage = image_name
                         db.session.commit()
                         flash("Projet mis a jour.", "success")
@@ -612,14 +696,15 @@ def create_app() -> Flask:
                 project_id = int(request.form.get("id", "0"))
                 target = Realisation.query.get(project_id)
                 if target:
-                    delete_static_image(target.libelleImage)
+                    schedule_image_delete(target.libelleImage)
                     db.session.delete(target)
                     db.session.commit()
                     flash("Projet supprime.", "success")
+            invalidate_site_context_cache()
             return redirect(url_for("backoffice_projects"))
 
-        projects = Realisation.query.order_by(Realisation.id.desc()).all()
-        return render_template("admin/projects.html", projects=projects)
+        pagination = paginate_admin(Realisation.query.order_by(Realisation.id.desc()))
+        return render_template("admin/projects.html", projects=pagination.items, pagination=pagination)
 
     @app.route("/backoffice/members", methods=["GET", "POST"])
     @admin_required
@@ -632,17 +717,16 @@ def create_app() -> Flask:
             action = request.form.get("action", "")
 
             if action == "create":
-                nom = request.form.get("nom", "").strip()
-                role = request.form.get("role", "").strip()
+                values = form_values(MEMBER_FIELDS)
                 photo = request.files.get("image")
-                if not nom:
+                if not values["nom"]:
                     flash("Le nom du membre est obligatoire.", "danger")
                 else:
                     image_name = save_image_upload(photo, prefix="member")
                     if photo and photo.filename and not image_name:
                         flash("Image invalide (jpg, jpeg, png, webp).", "danger")
                     else:
-                        db.session.add(MembreNotreEquipe(nom=nom, role=role, libelleImage=image_name, is_suspended=0))
+                        db.session.add(MembreNotreEquipe(**values, libelleImage=image_name, is_suspended=0))
                         db.session.commit()
                         flash("Membre ajoute.", "success")
 
@@ -650,15 +734,15 @@ def create_app() -> Flask:
                 member_id = int(request.form.get("id", "0"))
                 target = MembreNotreEquipe.query.get(member_id)
                 if target:
-                    target.nom = request.form.get("nom", "").strip()
-                    target.role = request.form.get("role", "").strip()
+                    for field, value in form_values(MEMBER_FIELDS).items():
+                        setattr(target, field, value)
                     photo = request.files.get("image")
                     image_name = save_image_upload(photo, prefix="member")
                     if photo and photo.filename and not image_name:
                         flash("Image invalide (jpg, jpeg, png, webp).", "danger")
                     else:
                         if image_name:
-                            delete_static_image(target.libelleImage)
+                            schedule_image_delete(target.libelleImage)
                             target.libelleImage = image_name
                         db.session.commit()
                         flash("Membre mis a jour.", "success")
@@ -667,14 +751,15 @@ def create_app() -> Flask:
                 member_id = int(request.form.get("id", "0"))
                 target = MembreNotreEquipe.query.get(member_id)
                 if target:
-                    delete_static_image(target.libelleImage)
+                    schedule_image_delete(target.libelleImage)
                     db.session.delete(target)
                     db.session.commit()
                     flash("Membre supprime.", "success")
+            invalidate_site_context_cache()
             return redirect(url_for("backoffice_members"))
 
-        members = MembreNotreEquipe.query.order_by(MembreNotreEquipe.id.desc()).all()
-        return render_template("admin/members.html", members=members)
+        pagination = paginate_admin(MembreNotreEquipe.query.order_by(MembreNotreEquipe.id.desc()))
+        return render_template("admin/members.html", members=pagination.items, pagination=pagination)
 
     @app.route("/backoffice/site-content", methods=["GET", "POST"])
     @admin_required
@@ -700,7 +785,7 @@ def create_app() -> Flask:
                     flash("Image invalide (jpg, jpeg, png, webp).", "danger")
                     return redirect(url_for("backoffice_site_content"))
                 if image_name:
-                    delete_static_image(header.logo)
+                    schedule_image_delete(header.logo)
                     header.logo = image_name
                 db.session.add(header)
                 db.session.commit()
@@ -770,6 +855,7 @@ def create_app() -> Flask:
                 db.session.commit()
                 flash("Contact footer mis a jour.", "success")
 
+            invalidate_chrome_cache()
             return redirect(url_for("backoffice_site_content"))
 
         header = Header.query.first()
@@ -831,6 +917,7 @@ def create_app() -> Flask:
                     db.session.commit()
                     flash("Domaine supprime.", "success")
 
+            invalidate_site_context_cache()
             return redirect(url_for("backoffice_domaines"))
 
         domaines = DomaineAccueil.query.order_by(DomaineAccueil.id.desc()).all()
@@ -883,6 +970,7 @@ def create_app() -> Flask:
                     db.session.commit()
                     flash("Membre propos supprime.", "success")
 
+            invalidate_site_context_cache()
             return redirect(url_for("backoffice_equipe_propos"))
 
         membres = EquipePropos.query.order_by(EquipePropos.id.desc()).all()
@@ -892,7 +980,6 @@ def create_app() -> Flask:
     @admin_required
     def backoffice_mailing() -> Any:
         g.active_page = "admin_mailing"
-        stats = None
         if request.method == "POST":
             if not verify_csrf_token(request.form.get("csrf_token", "")):
                 flash("Token CSRF invalide.", "danger")
@@ -901,30 +988,48 @@ def create_app() -> Flask:
             message = request.form.get("message", "").strip()
             if not subject or not message:
                 flash("Sujet et message sont obligatoires.", "danger")
+                return redirect(url_for("backoffice_mailing"))
+
+            campaign = MailCampaign(subject=subject, status="queued", created_at=now_iso())
+            db.session.add(campaign)
+            db.session.commit()
+            if current_app.config["MAIL_ASYNC"]:
+                submit_mail_job(run_mail_campaign, campaign.id, message)
+                flash("Campagne email lancee.", "success")
             else:
-                recipients = User.query.filter(User.is_active == 1, User.email.isnot(None), User.email != "").order_by(User.id.asc()).all()
-                sent = 0
-                failed = 0
-                for recipient in recipients:
-                    html = (
-                        f"<html><body><p>Bonjour {recipient.full_name},</p>"
-                        f"<p>{message.replace(chr(10), '<br>')}</p>"
-                        f"<p>Cordialement,<br>{SITE_NAME}</p></body></html>"
-                    )
-                    text = f"Bonjour {recipient.full_name},\n\n{message}\n\nCordialement,\n{SITE_NAME}"
-                    if send_mail(recipient.email, subject, text, html):
-                        sent += 1
-                    else:
-                        failed += 1
-                stats = {"total": len(recipients), "sent": sent, "failed": failed}
-                flash("Campagne email terminee.", "success")
+                run_mail_campaign(campaign.id, message)
+                if campaign.status == "aborted":
+                    flash("Campagne interrompue: aucun email n'a pu etre envoye.", "warning")
+                else:
+                    flash("Campagne email terminee.", "success")
+            return redirect(url_for("backoffice_mailing", campaign=campaign.id))
+
+        campaign_id = request.args.get("campaign", 0, type=int)
+        stats = db.session.get(MailCampaign, campaign_id) if campaign_id else None
+        if stats:
+            expire_stale_campaign(stats)
         return render_template("admin/mailing.html", stats=stats)
 
+    @app.get("/backoffice/api/mailing_status")
+    @admin_required
+    def backoffice_mailing_status() -> Any:
+        campaign = db.session.get(MailCampaign, request.args.get("id", 0, type=int))
+        if not campaign:
+            return {"error": "not_found"}, 404
+        expire_stale_campaign(campaign)
+        return {
+            "id": campaign.id,
+            "status": campaign.status,
+            "total": campaign.total,
+            "sent": campaign.sent,
+            "failed": campaign.failed,
+        }
+
     @app.route("/backoffice/chat")
     @admin_required
     def backoffice_chat() -> Any:
         g.active_page = "admin_chat"
-        user = current_user()
+        user = g.user
         ws_token = session.get("chat_ws_token")
         if not ws_token:
             ws_token = secrets.token_urlsafe(16)
@@ -935,7 +1040,7 @@ def create_app() -> Flask:
             ws_url = f"{scheme}://{request.host}/backoffice/ws"
         return render_template(
             "admin/chat.html",
-            current_user_id=user.id if user else 0,
+            current_user_id=user.id,
             api_base="/backoffice/api",
             ws_url=ws_url,
             ws_token=ws_token,
@@ -944,11 +1049,9 @@ def create_app() -> Flask:
     @app.get("/backoffice/api/chat_users")
     @admin_required
     def backoffice_chat_users() -> Any:
-        user = current_user()
-        if user is None:
-            return {"users": []}
+        user = g.user
         users = (
-            User.query.filter(User.id != user.id, User.is_active == 1)
+            User.query.filter(User.id != user.id, User.active)
             .order_by(User.full_name.asc())
             .all()
         )
@@ -962,9 +1065,7 @@ def create_app() -> Flask:
     @app.get("/backoffice/api/chat_fetch")
     @admin_required
     def backoffice_chat_fetch() -> Any:
-        user = current_user()
-        if user is None:
-            return {"error": "unauthorized"}, 401
+        user = g.user
         try:
             target_id = int(request.args.get("target_id", "0"))
         except ValueError:
@@ -979,21 +1080,20 @@ def create_app() -> Flask:
         messages_payload: list[dict[str, Any]] = []
         if conversation:
             messages = (
-                db.session.query(Message, User.full_name.label("sender_name"))
-                .join(User, User.id == Message.sender_id)
+                Message.query.options(joinedload(Message.sender, innerjoin=True))
                 .filter(Message.conversation_id == conversation.id)
                 .order_by(Message.id.asc())
                 .all()
             )
             messages_payload = [
                 {
-                    "id": row.Message.id,
-                    "sender_id": row.Message.sender_id,
-                    "content": row.Message.content,
-                    "created_at": row.Message.created_at or "",
-                    "sender_name": row.sender_name,
+                    "id": m.id,
+                    "sender_id": m.sender_id,
+                    "content": m.content,
+                    "created_at": m.created_at or "",
+                    "sender_name": m.sender.full_name,
                 }
-                for row in messages
+                for m in messages
             ]
         return {
             "target_user": {"id": target_user.id, "full_name": target_user.full_name},
@@ -1003,9 +1103,7 @@ def create_app() -> Flask:
     @app.post("/backoffice/api/chat_send")
     @admin_required
     def backoffice_chat_send() -> Any:
-        user = current_user()
-        if user is None:
-            return {"error": "unauthorized"}, 401
+        user = g.user
         if not verify_csrf_token(request.headers.get("X-CSRF-Token", "")):
             return {"error": "csrf_invalid"}, 400
         payload = request.get_json(silent=True) or {}
@@ -1057,6 +1155,70 @@ def create_app() -> Flask:
     return app
 
 
+def initialize_database(app: Flask) -> None:
+    with app.app_context():
+        db.create_all()
+        ensure_schema_compatibility()
+        backfill_suspension_flags()
+        ensure_indexes()
+        db.session.merge(SchemaMeta(key="fingerprint", value=schema_fingerprint()))
+        db.session.commit()
+
+
+def initialize_database_once(app: Flask) -> None:
+    with app.app_context():
+        # The stamp is only written once every step succeeded, so a match means nothing is left to do.
+        if stored_schema_fingerprint() != schema_fingerprint():
+            run_locked_initialization(app)
+        seed_default_admin()
+
+
+def run_locked_initialization(app: Flask) -> None:
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    # The lock only keeps workers booting together from racing on the same DDL; whoever gets it
+    # second finds the stamp already current.
+    database_key = zlib.crc32(app.config["SQLALCHEMY_DATABASE_URI"].encode())
+    lock_path = Path(tempfile.gettempdir()) / f"dgs-init-{database_key:08x}.lock"
+    try:
+        lock_file = open(lock_path, "a") if fcntl is not None else None
+    except OSError:
+        lock_file = None
+    if lock_file is None:
+        initialize_database(app)
+        return
+    with lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            if stored_schema_fingerprint() != schema_fingerprint():
+                initialize_database(app)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def schema_fingerprint() -> str:
+    # Any table, column or index change in the models produces a new fingerprint; data-only
+    # migrations bump SCHEMA_REVISION instead.
+    parts = [str(SCHEMA_REVISION)]
+    for table in db.metadata.sorted_tables:
+        columns = ",".join(column.name for column in table.columns)
+        indexes = ",".join(sorted(index.name for index in table.indexes if index.name))
+        parts.append(f"{table.name}({columns})[{indexes}]")
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def stored_schema_fingerprint() -> str | None:
+    try:
+        row = db.session.get(SchemaMeta, "fingerprint")
+    except SQLAlchemyError:
+        # schema_meta does not exist yet: a new or pre-stamp database.
+        db.session.rollback()
+        return None
+    return row.value if row else None
+
+
 def resolve_database_uri() -> str:
     database_url = os.getenv("DATABASE_URL", "").strip()
     if database_url:
@@ -1067,6 +1229,29 @@ def resolve_database_uri() -> str:
     return f"sqlite:///{Path(db_path).resolve()}"
 
 
+def resolve_engine_options(database_uri: str) -> dict[str, Any]:
+    options: dict[str, Any] = {"pool_recycle": 3600}
+    if not database_uri.startswith("sqlite"):
+        options["pool_size"] = 10
+        return options
+    options["connect_args"] = {"check_same_thread": False, "timeout": 15}
+    # In-memory databases run on a single static connection; only file databases get a real pool.
+    if ":memory:" not in database_uri and database_uri.rstrip("/") != "sqlite:":
+        options["pool_size"] = 10
+    return options
+
+
+@event.listens_for(Engine, "connect")
+def configure_sqlite_connection(dbapi_connection: Any, _: Any) -> None:
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    # WAL lets the public pages keep reading while the back office writes.
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
 def ensure_schema_compatibility() -> None:
     engine = db.engine
     if engine.dialect.name != "sqlite":
@@ -1106,39 +1291,81 @@ def ensure_schema_compatibility() -> None:
         },
     }
 
+    columns_query = text(
+        "SELECT m.name, p.name FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+        "WHERE m.type = 'table' AND m.name IN :names"
+    ).bindparams(bindparam("names", expanding=True))
+
     with engine.begin() as conn:
+        existing: dict[str, set[str]] = {}
+        for table_name, column_name in conn.execute(columns_query, {"names": list(required_columns)}):
+            existing.setdefault(table_name, set()).add(column_name)
+
         for table_name, columns in required_columns.items():
-            exists = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name = :name"),
-                {"name": table_name},
-            ).fetchone()
-            if not exists:
+            # Tables missing from the result do not exist, so there is nothing to migrate.
+            existing_columns = existing.get(table_name)
+            if existing_columns is None:
                 continue
-
-            rows = conn.execute(text(f"PRAGMA table_info({table_name})")).fetchall()
-            existing_columns = {row[1] for row in rows}
-
             for column_name, column_sql in columns.items():
                 if column_name in existing_columns:
                     continue
                 conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_sql}"))
 
 
+def backfill_suspension_flags() -> None:
+    # Rows imported before is_suspended existed hold NULL; normalising them lets the public
+    # pages filter on a plain indexed equality instead of "IS NULL OR = 0".
+    for model in (DomaineAccueil, EquipePropos, ServicesService, Realisation, MembreNotreEquipe):
+        db.session.execute(update(model).where(model.is_suspended.is_(None)).values(is_suspended=0))
+    db.session.commit()
+
+
+def ensure_indexes() -> None:
+    # create_all() only builds indexes for brand new tables; backfill them on existing databases.
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
+
 def current_user() -> User | None:
+    user = g.get("_user", _MISSING)
+    if user is not _MISSING:
+        return user
+    user = None
     user_id = session.get("site_user_id")
-    if not user_id:
-        return None
-    user = User.query.get(int(user_id))
-    if not user or int(user.is_active or 0) != 1:
-        return None
+    if user_id:
+        candidate = db.session.get(User, int(user_id), options=[load_only(User.id, User.is_active, User.role)])
+        if candidate and candidate.active:
+            user = candidate
+    g._user = user
     return user
 
 
+def email_taken(email: str, exclude_user_id: int | None = None) -> bool:
+    query = db.session.query(User.id).filter(User.email == email)
+    if exclude_user_id is not None:
+        query = query.filter(User.id != exclude_user_id)
+    return bool(db.session.query(query.exists()).scalar())
+
+
+def set_session_user(user: User | None) -> None:
+    if user is None:
+        # pop() flags the session as modified even for a missing key, forcing a needless cookie write.
+        if "site_user_id" in session:
+            session.pop("site_user_id")
+    else:
+        session["site_user_id"] = user.id
+    g._user = user
+
+
 def login_required(fn: Any) -> Any:
     @wraps(fn)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if current_user() is None:
+        user = current_user()
+        if user is None:
             return redirect(url_for("site_page", page="login"))
+        g.user = user
         return fn(*args, **kwargs)
 
     return wrapper
@@ -1150,21 +1377,63 @@ def admin_required(fn: Any) -> Any:
         user = current_user()
         if user is None or user.role != "admin":
             return redirect(url_for("backoffice_login"))
+        g.user = user
         return fn(*args, **kwargs)
 
     return wrapper
 
 
+def paginate_admin(query: Any) -> Any:
+    page = request.args.get("page", 1, type=int)
+    return query.paginate(page=page, per_page=ADMIN_PAGE_SIZE, error_out=False)
+
+
+def hash_password(password: str) -> str:
+    # Hashing is CPU-bound; the pool caps how many request threads can burn a core on it at once.
+    method = current_app.config["PASSWORD_HASH_METHOD"]
+    return PASSWORD_EXECUTOR.submit(generate_password_hash, password, method).result()
+
+
+def dummy_password_hash() -> str:
+    # Checked against when the email is unknown so both login outcomes cost one hash verification.
+    method = current_app.config["PASSWORD_HASH_METHOD"]
+    dummy = _DUMMY_HASHES.get(method)
+    if dummy is None:
+        # Built directly rather than on PASSWORD_EXECUTOR: create_app() calls this before a
+        # preloading server forks, and a child cannot use threads started in its parent.
+        dummy = _DUMMY_HASHES[method] = generate_password_hash(secrets.token_hex(16), method)
+    return dummy
+
+
+def check_password(password_hash: str | None, password: str) -> bool:
+    return PASSWORD_EXECUTOR.submit(check_password_hash, password_hash or dummy_password_hash(), password).result()
+
+
+def form_values(fields: tuple[str, ...]) -> dict[str, str]:
+    form = request.form.to_dict()
+    return {field: form.get(field, "").strip() for field in fields}
+
+
 def get_or_create_csrf_token() -> str:
+    token = g.get("_csrf")
+    if token:
+        return token
     token = session.get("csrf_token")
     if not token:
         token = secrets.token_hex(32)
         session["csrf_token"] = token
+    g._csrf = token
     return token
 
 
+def tokens_match(token: str, expected: str | None) -> bool:
+    if not token or not expected:
+        return False
+    return hmac.compare_digest(token.encode(), expected.encode())
+
+
 def verify_csrf_token(token: str) -> bool:
-    return bool(token) and token == session.get("csrf_token")
+    return tokens_match(token, session.get("csrf_token"))
 
 
 def verify_hcaptcha(token: str, remote_ip: str) -> bool:
@@ -1195,10 +1464,11 @@ def handle_login() -> Any:
         email = request.form.get("email", "").strip().lower()
         password = request.form.get("password", "")
         user = User.query.filter_by(email=email).first()
-        if not user or int(user.is_active or 0) != 1 or not check_password_hash(user.password_hash, password):
+        password_ok = check_password(user.password_hash if user else None, password)
+        if not user or not user.active or not password_ok:
             flash("Identifiants invalides.", "danger")
             return redirect(url_for("site_page", page="login"))
-        session["site_user_id"] = user.id
+        set_session_user(user)
         if user.role == "admin":
             return redirect(url_for("backoffice_index"))
         return redirect(url_for("site_page", page="compte"))
@@ -1225,7 +1495,7 @@ def handle_register() -> Any:
             flash("Les mots de passe ne correspondent pas.", "danger")
         elif len(password) < 8:
             flash("Mot de passe trop court (min 8).", "danger")
-        elif User.query.filter_by(email=email).first():
+        elif email_taken(email):
             flash("Cet email est deja utilise.", "danger")
         else:
             user = User(
@@ -1234,7 +1504,7 @@ def handle_register() -> Any:
                 email=email,
                 person_type=person_type,
                 preferred_lang=preferred_lang,
-                password_hash=generate_password_hash(password),
+                password_hash=hash_password(password),
                 role="client",
                 is_active=1,
                 created_at=now_iso(),
@@ -1248,9 +1518,8 @@ def handle_register() -> Any:
 
 @login_required
 def handle_profile() -> Any:
-    user = current_user()
-    if user is None:
-        return redirect(url_for("site_page", page="login"))
+    # login_required stashed the auth-only user on g; the profile page needs the whole row.
+    user = db.session.get(User, g.user.id, options=[undefer("*")], populate_existing=True)
     if request.method == "POST":
         if not verify_csrf_token(request.form.get("csrf_token", "")):
             flash("Token CSRF invalide.", "danger")
@@ -1266,7 +1535,7 @@ def handle_profile() -> Any:
                 flash("Tous les champs obligatoires doivent etre renseignes.", "danger")
             elif "@" not in email:
                 flash("Email invalide.", "danger")
-            elif User.query.filter(User.email == email, User.id != user.id).first():
+            elif email_taken(email, exclude_user_id=user.id):
                 flash("Cet email est deja utilise.", "danger")
             else:
                 user.full_name = full_name
@@ -1281,14 +1550,14 @@ def handle_profile() -> Any:
             current_password = request.form.get("current_password", "")
             new_password = request.form.get("new_password", "")
             confirm_new_password = request.form.get("confirm_new_password", "")
-            if not check_password_hash(user.password_hash, current_password):
+            if not check_password(user.password_hash, current_password):
                 flash("Mot de passe actuel incorrect.", "danger")
             elif len(new_password) < 8:
                 flash("Nouveau mot de passe trop court (min 8).", "danger")
             elif new_password != confirm_new_password:
                 flash("Les nouveaux mots de passe ne correspondent pas.", "danger")
             else:
-                user.password_hash = generate_password_hash(new_password)
+                user.password_hash = hash_password(new_password)
                 user.updated_at = now_iso()
                 db.session.commit()
                 flash("Mot de passe mis a jour.", "success")
@@ -1297,56 +1566,124 @@ def handle_profile() -> Any:
 
 
 def build_site_context(page: str) -> dict[str, Any]:
+    version = _SITE_CONTEXT_CACHE["v"]
+    entry = _SITE_CONTEXT_CACHE["pages"].get(page)
+    if entry is not None and entry[0] == version and time.monotonic() < entry[1]:
+        return entry[2]
+    context = query_site_context(page)
+    with _SITE_CONTEXT_LOCK:
+        _SITE_CONTEXT_CACHE["pages"][page] = (version, time.monotonic() + SITE_CONTEXT_TTL, context)
+    return context
+
+
+def invalidate_site_context_cache() -> None:
+    with _SITE_CONTEXT_LOCK:
+        _SITE_CONTEXT_CACHE["v"] += 1
+        _SITE_CONTEXT_CACHE["pages"].clear()
+
+
+def render_site_page(template_name: str, **context: Any) -> str:
+    # Site pages render cached plain dicts, where a missing key would silently print nothing;
+    # in debug and tests it raises instead.
+    if not (current_app.debug or current_app.testing):
+        return render_template(template_name, **context)
+    strict_env = current_app.extensions.get("strict_jinja_env")
+    if strict_env is None:
+        # Its own cache: overlays share the parent's by default, which would mix lenient and strict templates.
+        strict_env = current_app.jinja_env.overlay(undefined=StrictUndefined, cache_size=50)
+        current_app.extensions["strict_jinja_env"] = strict_env
+    return render_template(strict_env.get_template(template_name), **context)
+
+
+def as_dict(obj: Any, **extra: Any) -> dict[str, Any]:
+    data = {column.key: getattr(obj, column.key) for column in sa_inspect(obj).mapper.column_attrs}
+    data.update(extra)
+    return data
+
+
+def query_site_context(page: str) -> dict[str, Any]:
+    # Rows are copied into plain dicts so the cached context never holds session-bound instances.
     if page == "accueil":
         return {
-            "domaines": DomaineAccueil.query.filter(
-                or_(DomaineAccueil.is_suspended.is_(None), DomaineAccueil.is_suspended == 0)
-            ).order_by(DomaineAccueil.id.desc()).all()
+            "domaines": [as_dict(row) for row in DomaineAccueil.query.filter(
+                DomaineAccueil.is_suspended == 0
+            ).order_by(DomaineAccueil.id.desc())]
         }
     if page == "propos":
         return {
-            "membres": EquipePropos.query.filter(
-                or_(EquipePropos.is_suspended.is_(None), EquipePropos.is_suspended == 0)
-            ).order_by(EquipePropos.id.desc()).all()
+            "membres": [as_dict(row) for row in EquipePropos.query.filter(
+                EquipePropos.is_suspended == 0
+            ).order_by(EquipePropos.id.desc())]
         }
     if page == "services":
         return {
-            "services_catalog": ServicesCatalog.query.filter_by(status="active").order_by(ServicesCatalog.id.desc()).all(),
-            "legacy_services": ServicesService.query.filter(
-                or_(ServicesService.is_suspended.is_(None), ServicesService.is_suspended == 0)
-            ).order_by(ServicesService.id.desc()).all(),
+            "services_catalog": [
+                as_dict(row) for row in ServicesCatalog.query.filter_by(status="active").order_by(ServicesCatalog.id.desc())
+            ],
+            "legacy_services": [as_dict(row) for row in ServicesService.query.filter(
+                ServicesService.is_suspended == 0
+            ).order_by(ServicesService.id.desc())],
         }
     if page == "realisation":
         return {
-            "realisations": Realisation.query.filter(
-                or_(Realisation.is_suspended.is_(None), Realisation.is_suspended == 0)
-            ).order_by(Realisation.id.desc()).all()
+            "realisations": [as_dict(row) for row in Realisation.query.filter(
+                Realisation.is_suspended == 0
+            ).order_by(Realisation.id.desc())]
         }
     if page == "notreEquipe":
         people = (
-            db.session.query(
-                ServicePeople,
-                func.group_concat(ServicesCatalog.name, ", ").label("service_names"),
-            )
-            .outerjoin(ServicePeople.services)
-            .filter(ServicePeople.is_active == 1)
-            .group_by(ServicePeople.id)
+            ServicePeople.query.options(selectinload(ServicePeople.services), raiseload("*"))
+            .filter_by(is_active=1)
             .order_by(ServicePeople.id.desc())
             .all()
         )
-        people_rows = []
-        for person, service_names in people:
-            person.service_names = service_names
-            people_rows.append(person)
         return {
-            "service_people": people_rows,
-            "membres": MembreNotreEquipe.query.filter(
-                or_(MembreNotreEquipe.is_suspended.is_(None), MembreNotreEquipe.is_suspended == 0)
-            ).order_by(MembreNotreEquipe.id.desc()).all(),
+            "service_people": [
+                as_dict(person, service_names=", ".join(service.name for service in person.services))
+                for person in people
+            ],
+            "membres": [as_dict(row) for row in MembreNotreEquipe.query.filter(
+                MembreNotreEquipe.is_suspended == 0
+            ).order_by(MembreNotreEquipe.id.desc())],
         }
     return {}
 
 
+def dashboard_counts() -> tuple[int, int, int, int]:
+    tables = (User.__tablename__, ServicesCatalog.__tablename__, ServicePeople.__tablename__, Message.__tablename__)
+    counts = ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in tables)
+    row = db.session.execute(text(f"SELECT {counts}")).one()
+    return tuple(int(value or 0) for value in row)
+
+
+def get_chrome_context() -> dict[str, Any]:
+    chrome = g.get("_chrome")
+    if chrome is not None:
+        return chrome
+
+    # Header/footer rows only change through the site-content back-office, so they are
+    # shared across requests until an admin edit bumps the version or the TTL runs out.
+    version = _FOOTER_CACHE["v"]
+    chrome = _FOOTER_CACHE["data"]
+    if chrome is None or _FOOTER_CACHE["data_v"] != version or time.monotonic() >= _FOOTER_CACHE["expires"]:
+        header = db.session.execute(db.select(Header.logo, Header.nom, Header.slogan).limit(1)).mappings().first()
+        contact = db.session.execute(db.select(ContactFooter.email, ContactFooter.telephone).limit(1)).mappings().first()
+        chrome = {
+            "header_data": dict(header) if header else None,
+            "footer_socials": [dict(row) for row in db.session.execute(db.select(ReseauFooter.icon, ReseauFooter.lien)).mappings()],
+            "footer_services": [dict(row) for row in db.session.execute(db.select(ServicesFooter.criteres)).mappings()],
+            "footer_contact": dict(contact) if contact else None,
+        }
+        _FOOTER_CACHE.update(data=chrome, data_v=version, expires=time.monotonic() + CHROME_CACHE_TTL)
+
+    g._chrome = chrome
+    return chrome
+
+
+def invalidate_chrome_cache() -> None:
+    _FOOTER_CACHE["v"] += 1
+
+
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -1393,7 +1730,7 @@ def backoffice_ws(ws: Any) -> None:
     user = current_user()
     token = request.args.get("token", "")
     session_token = session.get("chat_ws_token", "")
-    if not user or user.role != "admin" or not token or token != session_token:
+    if not user or user.role != "admin" or not tokens_match(token, session_token):
         try:
             ws.close()
         finally:
@@ -1417,7 +1754,15 @@ def backoffice_ws(ws: Any) -> None:
             CHAT_SOCKETS.remove(connection)
 
 
+def is_image_header(header: bytes) -> bool:
+    if header.startswith(b"RIFF"):
+        return header[8:12] == b"WEBP"
+    return header.startswith(IMAGE_SIGNATURES)
+
+
 def save_image_upload(file_storage: Any, prefix: str, subdir: str | None = None) -> str | None:
+    if prefix not in IMAGE_PREFIXES:
+        raise ValueError(f"Unknown image prefix: {prefix}")
     if not file_storage or not file_storage.filename:
         return None
 
@@ -1425,17 +1770,54 @@ def save_image_upload(file_storage: Any, prefix: str, subdir: str | None = None)
     if extension not in ALLOWED_IMAGE_EXTENSIONS:
         return None
 
-    filename = secure_filename(f"{prefix}_{secrets.token_hex(8)}{extension}")
+    stream = file_storage.stream
+    header = stream.read(12)
+    if not is_image_header(header):
+        return None
+
+    # Every part of the name is already safe: a whitelisted prefix, hex and a whitelisted extension.
+    filename = f"{prefix}_{secrets.token_hex(8)}{extension}"
     if subdir:
         target_dir = (BASE_DIR / "static" / subdir).resolve()
         target_dir.mkdir(parents=True, exist_ok=True)
-        destination = target_dir / filename
-        file_storage.save(destination)
-        return f"{subdir}/{filename}".replace("\\", "/")
+        reference = f"{subdir}/{filename}".replace("\\", "/")
+    else:
+        target_dir = IMAGE_DIR
+        reference = filename
 
-    destination = IMAGE_DIR / filename
-    file_storage.save(destination)
-    return filename
+    destination = target_dir / filename
+    partial = target_dir / f"{filename}.tmp"
+    try:
+        with open(partial, "wb", buffering=UPLOAD_CHUNK_SIZE) as out:
+            out.write(header)
+            shutil.copyfileobj(stream, out, UPLOAD_CHUNK_SIZE)
+        os.replace(partial, destination)
+    except Exception:
+        partial.unlink(missing_ok=True)
+        raise
+    return reference
+
+
+def schedule_image_delete(reference: str | None) -> None:
+    if not reference:
+        return
+    pending = g.setdefault("_pending_unlinks", [])
+    pending.append(reference)
+
+
+@event.listens_for(db.session, "after_commit")
+def flush_pending_image_deletes(_: Any) -> None:
+    if not has_app_context():
+        return
+    pending = g.pop("_pending_unlinks", None)
+    for reference in pending or ():
+        FILE_EXECUTOR.submit(delete_static_image, reference)
+
+
+@event.listens_for(db.session, "after_rollback")
+def discard_pending_image_deletes(_: Any) -> None:
+    if has_app_context():
+        g.pop("_pending_unlinks", None)
 
 
 def delete_static_image(reference: str | None) -> None:
@@ -1443,22 +1825,95 @@ def delete_static_image(reference: str | None) -> None:
         return
 
     # Handles both "images/..." and bare filenames stored in legacy tables.
-    if "/" in reference or "\\" in reference:
-        candidate = (BASE_DIR / "static" / reference).resolve()
-    else:
-        candidate = (IMAGE_DIR / reference).resolve()
+    base = _STATIC_ROOT if "/" in reference or "\\" in reference else _IMAGE_ROOT
+    candidate = os.path.normpath(os.path.join(base, reference))
+    if candidate.startswith(_STATIC_ROOT) and os.path.isfile(candidate):
+        try:
+            os.unlink(candidate)
+        except FileNotFoundError:
+            pass
 
-    static_root = (BASE_DIR / "static").resolve()
-    if str(candidate).startswith(str(static_root)) and candidate.is_file():
-        candidate.unlink(missing_ok=True)
 
+def submit_mail_job(fn: Callable[..., Any], *args: Any) -> None:
+    app = current_app._get_current_object()
+
+    def run() -> None:
+        with app.app_context():
+            try:
+                if fn(*args) is False:
+                    app.logger.error("Background mail job %s failed for %s", fn.__name__, args[0] if args else "-")
+            except Exception:
+                app.logger.exception("Background mail job failed")
+
+    MAIL_EXECUTOR.submit(run)
+
+
+def expire_stale_campaign(campaign: MailCampaign) -> None:
+    # A worker killed or recycled mid-campaign never reports back; give up on it after a bound.
+    if campaign.status not in ("queued", "running") or not campaign.created_at:
+        return
+    created_at = datetime.fromisoformat(campaign.created_at)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    age = datetime.now(timezone.utc) - created_at
+    if age.total_seconds() < MAIL_CAMPAIGN_TIMEOUT:
+        return
+    campaign.status = "stale"
+    campaign.finished_at = now_iso()
+    db.session.commit()
+
+
+def run_mail_campaign(campaign_id: int, message: str) -> None:
+    campaign = db.session.get(MailCampaign, campaign_id)
+    if campaign is None:
+        return
+    recipient_filter = (User.active, User.email.isnot(None), User.email != "")
+    campaign.status = "running"
+    campaign.total = db.session.query(func.count(User.id)).filter(*recipient_filter).scalar() or 0
+    db.session.commit()
+    recipients = (
+        db.session.query(User.email, User.full_name)
+        .filter(*recipient_filter)
+        .order_by(User.id.asc())
+        .yield_per(500)
+    )
+
+    template = current_app.jinja_env.get_template("mail/campaign.html")
+    message_html = Markup(message.replace("\n", "<br>"))
+
+    def build_body(recipient: Any) -> tuple[str, str]:
+        html = template.render(name=recipient.full_name, body=message_html, site_name=SITE_NAME)
+        text = f"Bonjour {recipient.full_name},\n\n{message}\n\nCordialement,\n{SITE_NAME}"
+        return text, html
+
+    def record_progress(sent: int, failed: int) -> None:
+        # The session's connection is busy streaming recipients, so progress goes through its own.
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(
+                    update(MailCampaign).where(MailCampaign.id == campaign_id).values(sent=sent, failed=failed)
+                )
+        except Exception:
+            current_app.logger.warning("Could not record progress for mail campaign %s", campaign_id, exc_info=True)
+
+    sent, failed, aborted = send_bulk(
+        recipients,
+        campaign.subject,
+        build_body,
+        abort_after=max(10, campaign.total // 3),
+        on_progress=record_progress,
+    )
+    campaign.sent = sent
+    campaign.failed = failed
+    campaign.status = "aborted" if aborted else "done"
+    campaign.finished_at = now_iso()
+    db.session.commit()
+
+
+def build_mail_message(to_email: str, subject: str, text_body: str, html_body: str, reply_to: str = "") -> MIMEMultipart:
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
 
-def send_mail(to_email: str, subject: str, text_body: str, html_body: str, reply_to: str = "") -> bool:
-    if not current_app.config["MAIL_ENABLED"]:
-        return True
-    host = current_app.config["MAIL_HOST"]
-    if not host:
-        return True
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
     msg["From"] = current_app.config["MAIL_FROM"]
@@ -1467,21 +1922,114 @@ def send_mail(to_email: str, subject: str, text_body: str, html_body: str, reply
         msg["Reply-To"] = reply_to
     msg.attach(MIMEText(text_body, "plain", "utf-8"))
     msg.attach(MIMEText(html_body, "html", "utf-8"))
+    return msg
+
+
+def open_smtp_connection() -> smtplib.SMTP:
+    # Mail modules are imported on first use so workers that never send mail never load them.
+    import smtplib
+
+    smtp_class = smtplib.SMTP_SSL if current_app.config["MAIL_USE_SSL"] else smtplib.SMTP
+    smtp = smtp_class(current_app.config["MAIL_HOST"], current_app.config["MAIL_PORT"], timeout=8)
+    try:
+        if current_app.config["MAIL_USE_TLS"] and not current_app.config["MAIL_USE_SSL"]:
+            smtp.starttls()
+        if current_app.config["MAIL_USERNAME"]:
+            smtp.login(current_app.config["MAIL_USERNAME"], current_app.config["MAIL_PASSWORD"])
+    except Exception:
+        close_smtp_connection(smtp)
+        raise
+    return smtp
+
+
+def close_smtp_connection(smtp: smtplib.SMTP | None) -> None:
+    if smtp is None:
+        return
+    try:
+        smtp.quit()
+    except Exception:
+        smtp.close()
+
+
+def send_mail(to_email: str, subject: str, text_body: str, html_body: str, reply_to: str = "") -> bool:
+    if not current_app.config["MAIL_ENABLED"]:
+        return True
+    host = current_app.config["MAIL_HOST"]
+    if not host:
+        return True
+    msg = build_mail_message(to_email, subject, text_body, html_body, reply_to)
     try:
-        smtp_class = smtplib.SMTP_SSL if current_app.config["MAIL_USE_SSL"] else smtplib.SMTP
-        with smtp_class(host, current_app.config["MAIL_PORT"], timeout=8) as smtp:
-            if current_app.config["MAIL_USE_TLS"] and not current_app.config["MAIL_USE_SSL"]:
-                smtp.starttls()
-            if current_app.config["MAIL_USERNAME"]:
-                smtp.login(current_app.config["MAIL_USERNAME"], current_app.config["MAIL_PASSWORD"])
+        smtp = open_smtp_connection()
+        try:
             smtp.sendmail(msg["From"], [to_email], msg.as_string())
+        finally:
+            close_smtp_connection(smtp)
         return True
     except Exception:
         return False
 
 
+def send_bulk(
+    recipients: Iterable[Any],
+    subject: str,
+    build_body: Callable[[Any], tuple[str, str]],
+    abort_after: int = 0,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> tuple[int, int, bool]:
+    sent = 0
+    failed = 0
+    if not current_app.config["MAIL_ENABLED"] or not current_app.config["MAIL_HOST"]:
+        for _ in recipients:
+            sent += 1
+        return sent, failed, False
+
+    import smtplib
+
+    smtp: smtplib.SMTP | None = None
+    sent_on_connection = 0
+    try:
+        for recipient in recipients:
+            text_body, html_body = build_body(recipient)
+            msg = build_mail_message(recipient.email, subject, text_body, html_body)
+            payload = msg.as_string()
+            # One retry on a dropped connection or a transient (4xx) reply; anything else only
+            # fails this recipient.
+            for attempt in range(2):
+                try:
+                    if smtp is None or sent_on_connection >= MAIL_CONNECTION_RECYCLE:
+                        close_smtp_connection(smtp)
+                        smtp = None
+                        smtp = open_smtp_connection()
+                        sent_on_connection = 0
+                    smtp.sendmail(msg["From"], [recipient.email], payload)
+                    sent_on_connection += 1
+                    sent += 1
+                    break
+                except smtplib.SMTPServerDisconnected:
+                    close_smtp_connection(smtp)
+                    smtp = None
+                    if attempt:
+                        failed += 1
+                except smtplib.SMTPResponseException as exc:
+                    if 400 <= exc.smtp_code < 500 and not attempt:
+                        continue
+                    failed += 1
+                    break
+                except Exception:
+                    failed += 1
+                    break
+            if on_progress and (sent + failed) % MAIL_PROGRESS_EVERY == 0:
+                on_progress(sent, failed)
+            # Nothing has gone through yet: this is a configuration or network problem, not a bad address.
+            if abort_after and not sent and failed >= abort_after:
+                return sent, failed, True
+    finally:
+        close_smtp_connection(smtp)
+    return sent, failed, False
+
+
 def seed_default_admin() -> None:
-    if User.query.count() > 0:
+    if db.session.query(User.id).limit(1).first() is not None:
         return
     email = os.getenv("ADMIN_BOOTSTRAP_EMAIL", "").strip().lower()
     password = os.getenv("ADMIN_BOOTSTRAP_PASSWORD", "")
@@ -1491,7 +2039,8 @@ def seed_default_admin() -> None:
     admin = User(
         full_name=full_name,
         email=email,
-        password_hash=generate_password_hash(password),
+        # Not hash_password(): this runs in create_app(), before a preloading server forks.
+        password_hash=generate_password_hash(password, current_app.config["PASSWORD_HASH_METHOD"]),
         role="admin",
         is_active=1,
         person_type="chef_entreprise",
@@ -1499,7 +2048,11 @@ def seed_default_admin() -> None:
         created_at=now_iso(),
     )
     db.session.add(admin)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another worker seeded it first.
+        db.session.rollback()
 
 
 assert_flask_werkzeug_compatibility()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.ext.hybrid import hybrid_property
 
 db = SQLAlchemy()
 
@@ -13,6 +14,7 @@ service_person_services = db.Table(
 
 class User(db.Model):
     __tablename__ = "users"
+    __table_args__ = (db.Index("ix_users_is_active_email", "is_active", "email"),)
 
     id = db.Column(db.Integer, primary_key=True)
     full_name = db.Column(db.Text, nullable=False)
@@ -27,6 +29,10 @@ class User(db.Model):
     updated_at = db.Column(db.Text)
     last_login_at = db.Column(db.Text)
 
+    @hybrid_property
+    def active(self) -> bool:
+        return self.is_active == 1
+
 
 class ServicesCatalog(db.Model):
     __tablename__ = "services_catalog"
@@ -41,6 +47,7 @@ class ServicesCatalog(db.Model):
 
 class ServicePeople(db.Model):
     __tablename__ = "service_people"
+    __table_args__ = (db.Index("ix_service_people_active_id", "is_active", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     full_name = db.Column(db.Text, nullable=False)
@@ -50,7 +57,7 @@ class ServicePeople(db.Model):
     photo_path = db.Column(db.Text)
     is_active = db.Column(db.Integer, nullable=False, default=1)
     created_at = db.Column(db.Text)
-    services = db.relationship("ServicesCatalog", secondary=service_person_services, lazy="select")
+    services = db.relationship("ServicesCatalog", secondary=service_person_services, lazy="selectin")
 
 
 class Message(db.Model):
@@ -58,10 +65,31 @@ class Message(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     conversation_id = db.Column(db.Integer, db.ForeignKey("conversations.id"), nullable=False)
-    sender_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    sender_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
     content = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.Text)
     read_at = db.Column(db.Text)
+    sender = db.relationship("User", lazy="raise")
+
+
+class MailCampaign(db.Model):
+    __tablename__ = "mail_campaigns"
+
+    id = db.Column(db.Integer, primary_key=True)
+    subject = db.Column(db.Text, nullable=False)
+    status = db.Column(db.Text, nullable=False, default="queued")
+    total = db.Column(db.Integer, nullable=False, default=0)
+    sent = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.Text)
+    finished_at = db.Column(db.Text)
+
+
+class SchemaMeta(db.Model):
+    __tablename__ = "schema_meta"
+
+    key = db.Column(db.Text, primary_key=True)
+    value = db.Column(db.Text, nullable=False)
 
 
 class Conversation(db.Model):
@@ -85,37 +113,41 @@ class Header(db.Model):
 
 class DomaineAccueil(db.Model):
     __tablename__ = "domaine_accueil"
+    __table_args__ = (db.Index("ix_domaine_accueil_suspended_id", "is_suspended", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     icon = db.Column(db.Text)
     nom = db.Column(db.Text)
     description = db.Column(db.Text)
-    is_suspended = db.Column(db.Integer, default=0)
+    is_suspended = db.Column(db.Integer, default=0, server_default="0")
 
 
 class EquipePropos(db.Model):
     __tablename__ = "equipe_propos"
+    __table_args__ = (db.Index("ix_equipe_propos_suspended_id", "is_suspended", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     icon = db.Column(db.Text)
     nom = db.Column(db.Text)
     description = db.Column(db.Text)
-    is_suspended = db.Column(db.Integer, default=0)
+    is_suspended = db.Column(db.Integer, default=0, server_default="0")
 
 
 class ServicesService(db.Model):
     __tablename__ = "services_service"
+    __table_args__ = (db.Index("ix_services_service_suspended_id", "is_suspended", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     nom = db.Column(db.Text)
     description = db.Column(db.Text)
     criteres_services = db.Column(db.Text)
     libelleImage = db.Column(db.Text)
-    is_suspended = db.Column(db.Integer, default=0)
+    is_suspended = db.Column(db.Integer, default=0, server_default="0")
 
 
 class Realisation(db.Model):
     __tablename__ = "realisation_realisation"
+    __table_args__ = (db.Index("ix_realisation_realisation_suspended_id", "is_suspended", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     nom = db.Column(db.Text)
@@ -124,17 +156,18 @@ class Realisation(db.Model):
     criteres_services = db.Column(db.Text)
     libelleImage = db.Column(db.Text)
     categorie = db.Column(db.Text)
-    is_suspended = db.Column(db.Integer, default=0)
+    is_suspended = db.Column(db.Integer, default=0, server_default="0")
 
 
 class MembreNotreEquipe(db.Model):
     __tablename__ = "membre_notreequipe"
+    __table_args__ = (db.Index("ix_membre_notreequipe_suspended_id", "is_suspended", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     libelleImage = db.Column(db.Text)
     nom = db.Column(db.Text)
     role = db.Column(db.Text)
-    is_suspended = db.Column(db.Integer, default=0)
+    is_suspended = db.Column(db.Integer, default=0, server_default="0")
 
 
 class ReseauFooter(db.Model):
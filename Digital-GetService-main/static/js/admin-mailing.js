@@ -0,0 +1,40 @@
+(() => {
+    const panel = document.querySelector('[data-campaign-status-url]');
+    if (!panel) {
+        return;
+    }
+
+    const statusUrl = panel.dataset.campaignStatusUrl;
+    // The server marks stuck campaigns as stale, but never poll an open tab forever.
+    const maxPolls = 200;
+    let polls = 0;
+
+    const poll = async () => {
+        polls += 1;
+        if (polls > maxPolls) {
+            return;
+        }
+        try {
+            const response = await fetch(statusUrl, { headers: { Accept: 'application/json' } });
+            if (!response.ok) {
+                return;
+            }
+            const data = await response.json();
+            if (data.status !== 'queued' && data.status !== 'running') {
+                window.location.reload();
+                return;
+            }
+            ['total', 'sent', 'failed'].forEach((name) => {
+                const field = panel.querySelector(`[data-field="${name}"]`);
+                if (field) {
+                    field.textContent = data[name];
+                }
+            });
+            setTimeout(poll, 3000);
+        } catch (error) {
+            setTimeout(poll, 5000);
+        }
+    };
+
+    setTimeout(poll, 3000);
+})();